@@ -0,0 +1,29 @@
+"""
+Measures submissions/second of Exercise.validate_many with different amount of processes
+Usage: python benchmarks/bench_batch.py [submissions]
+"""
+import os
+import sys
+from time import perf_counter
+
+from kipygen import Exercise
+
+
+def main(submissions: int = 200) -> None:
+    e = Exercise.load((('TaskRange', ), ))
+    factory = 'kipygen.tasks:TaskRange.generator'
+    print(f"{'Workers':>7} {'submissions/s':>14} {'scaling':>8}")
+    base = None
+    workers = 1
+    while workers <= (os.cpu_count() or 1):
+        start = perf_counter()
+        for _ in e.validate_many([factory] * submissions, workers=workers):
+            pass
+        rate = submissions / (perf_counter() - start)
+        base = base or rate
+        print(f"{workers:>7} {rate:>14.1f} {rate / base:>7.2f}x")
+        workers *= 2
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:2]))
@@ -0,0 +1,72 @@
+"""
+Compares iterations/second of Exercise validation with checker thread
+created for every iteration (previous behaviour), with persistent pooled worker
+and with direct execution in calling thread
+Usage: python benchmarks/bench_workers.py [seconds per measurement]
+"""
+import sys
+from queue import Queue
+from time import perf_counter
+
+from kipygen import Exercise, TaskMeta, iterations_limit
+from kipygen.workers import CheckerWorker, WorkerPool, direct_worker
+
+
+def thread_per_iteration(exercise: Exercise, factory, vectors) -> None:
+    for values in vectors:
+        worker = CheckerWorker(Queue)
+        exercise._validate_iteration(factory(), values, worker)
+        worker.stop()
+
+
+def pooled(exercise: Exercise, factory, vectors, pool: WorkerPool) -> None:
+    worker = pool.acquire()
+    try:
+        for values in vectors:
+            exercise._validate_iteration(factory(), values, worker)
+    finally:
+        pool.release(worker)
+
+
+def direct(exercise: Exercise, factory, vectors) -> None:
+    for values in vectors:
+        exercise._validate_iteration(factory(), values, direct_worker)
+
+
+def measure(function, vectors, seconds: float) -> float:
+    iterations = 0
+    start = perf_counter()
+    while perf_counter() - start < seconds:
+        function(vectors)
+        iterations += len(vectors)
+    return iterations / (perf_counter() - start)
+
+
+def main(seconds: float = 1.0) -> None:
+    pool = WorkerPool(1)
+    print(
+        f"{'Task':<24} {'thread/iter it/s':>18} {'pooled it/s':>14} {'speedup':>8}"
+        f" {'direct it/s':>14} {'speedup':>8}"
+    )
+    for task in TaskMeta.all_tasks:
+        task = task(next(task.init_values()))
+        exercise = Exercise([task])
+        vectors = [*iterations_limit(exercise.check_values(), 50)]
+        before = measure(
+            lambda v: thread_per_iteration(exercise, task.generator, v), vectors, seconds
+        )
+        after = measure(
+            lambda v: pooled(exercise, task.generator, v, pool), vectors, seconds
+        )
+        inline = measure(
+            lambda v: direct(exercise, task.generator, v), vectors, seconds
+        )
+        print(
+            f"{type(task).__qualname__:<24} {before:>18.0f} {after:>14.0f} "
+            f"{after / before:>7.1f}x {inline:>14.0f} {inline / before:>7.1f}x"
+        )
+    pool.close()
+
+
+if __name__ == '__main__':
+    main(*map(float, sys.argv[1:2]))
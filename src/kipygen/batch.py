@@ -0,0 +1,97 @@
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, FIRST_COMPLETED, wait
+from importlib import import_module
+from typing import Any, Callable, Dict, Generator, Iterable, NamedTuple, Optional, Tuple, Union
+
+from .exercise import Exercise
+
+__all__ = (
+    'Submission',
+    'Verdict',
+    'resolve_factory',
+    'validate_many',
+)
+
+
+# Generator factory (should be picklable) or import path 'package.module:qualname'
+Submission = Union[Callable[[], Generator], str]
+
+
+class Verdict(NamedTuple):
+    index: int
+    exercise: Tuple[Tuple[str, ...], ...]
+    output: str
+
+    @property
+    def passed(self) -> bool:
+        return not self.output
+
+
+def resolve_factory(submission: Submission) -> Callable[[], Generator]:
+    """ Returns generator factory from submission
+    :param submission: Generator factory or import path like 'package.module:Class.method'
+    """
+    if not isinstance(submission, str):
+        return submission
+    module_name, _, qualname = submission.partition(':')
+    if not qualname:
+        raise ValueError(f"Import path '{submission}' should be in form 'module:qualname'")
+    value: Any = import_module(module_name)
+    for attribute in qualname.split('.'):
+        value = getattr(value, attribute)
+    return value
+
+
+def _validate_job(
+        exercise: Tuple[Tuple[str, ...], ...],
+        submission: Submission,
+        kwargs: Dict[str, Any]
+) -> str:
+    try:
+        factory = resolve_factory(submission)
+    except Exception as e:
+        return f"Не удалось загрузить решение: {type(e).__qualname__}({e.args})"
+    return Exercise.load(exercise).validate(factory, **kwargs)
+
+
+def validate_many(
+        jobs: Iterable[Tuple[Exercise, Submission]],
+        workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        **kwargs: Any
+) -> Generator[Verdict, None, None]:
+    """
+    Validates submissions in pool of processes. Exercises are passed to
+    processes with Exercise.save()/Exercise.load()
+    :param jobs: Pairs of exercise and submission to validate with it
+    :param workers: Amount of processes. Ignored, if executor passed
+    :param executor: Executor to use instead of new ProcessPoolExecutor
+    :param kwargs: Arguments passed to Exercise.validate()
+    :return: Generator of verdicts in order of completion
+    """
+    if executor is None:
+        with ProcessPoolExecutor(workers) as executor:
+            yield from validate_many(jobs, executor=executor, **kwargs)
+        return
+    # Amount of submitted, but not finished jobs. Keeps memory bounded for long job lists
+    max_pending = 4 * (getattr(executor, '_max_workers', None) or 1)
+    pending: Dict[Future, Tuple[int, Tuple[Tuple[str, ...], ...]]] = dict()
+    for index, (exercise, submission) in enumerate(jobs):
+        saved = exercise.save()
+        pending[executor.submit(_validate_job, saved, submission, kwargs)] = (index, saved)
+        if len(pending) >= max_pending:
+            yield from _collect(pending)
+    while pending:
+        yield from _collect(pending)
+
+
+def _collect(
+        pending: Dict[Future, Tuple[int, Tuple[Tuple[str, ...], ...]]]
+) -> Generator[Verdict, None, None]:
+    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+    for future in done:
+        index, saved = pending.pop(future)
+        try:
+            output = future.result()
+        except Exception as e:
+            output = f"Ошибка проверки решения: {type(e).__qualname__}({e.args})"
+        yield Verdict(index, saved, output)
@@ -1,5 +1,7 @@
 from queue import Queue
-from typing import Any, Type, Generator
+from typing import Any, Callable, Generator, Tuple, Type
+
+from .checkers import Raised
 
 __all__ = (
     'CheckHook',
@@ -49,6 +51,18 @@ class CheckHook:
         """
         raise NotImplementedError()
 
+    def direct(self, gen: Generator) -> Any:
+        """ Called instead of __call__, when generator runs in calling thread
+        Default implementation passes __call__ channel, which executes methods immediately
+        :param gen: Running generator to validate
+        :return: value from generator. Exceptions are allowed to propagate
+        """
+        channel = _InlineChannel()
+        value = self(channel, channel, gen)
+        if isinstance(value, Raised):
+            raise value.exception
+        return value
+
     def name(self) -> str:
         raise NotImplementedError()
 
@@ -56,6 +70,24 @@ class CheckHook:
         raise NotImplementedError()
 
 
+class _InlineChannel:
+    """ Replacement of q_in/q_out pair: put() executes method, get() returns result """
+    __slots__ = ('value',)
+
+    def put(self, value: Tuple[Callable[[Any], Any], Any]) -> None:
+        method, value = value
+        try:
+            self.value = method(value)
+        except BaseException as e:
+            self.value = Raised(e)
+
+    def get(self) -> Any:
+        return self.value
+
+    def task_done(self) -> None:
+        pass
+
+
 class GenThrow(CheckHook):
     __slots__ = ('exception',)
 
@@ -72,6 +104,9 @@ class GenThrow(CheckHook):
         q_in.put((gen.throw, self.exception))
         return q_out.get()
 
+    def direct(self, gen: Generator) -> Any:
+        return gen.throw(self.exception)
+
     def name(self) -> str:
         return f"Отправка исключения {self.exception.__qualname__}"
 
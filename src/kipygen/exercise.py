@@ -1,15 +1,20 @@
 from io import StringIO
-from typing import Dict, Generator, List, Callable, Tuple, TypeVar
+from typing import (
+    Any, Dict, Generator, Iterable, List, Callable, Optional, Tuple, TypeVar, TYPE_CHECKING
+)
 from random import shuffle
 from itertools import combinations
 from math import factorial
-from threading import Thread
-from queue import Queue
+from time import perf_counter
 
 from .meta import TaskMeta, ValuesTuple
 from .checkers import Checker, Raised
 from .checkhooks import CheckHook
 from .tasks import iterations_limit
+from .workers import Worker, WorkerPool, WorkerTimeout, default_pool, direct_worker
+
+if TYPE_CHECKING:
+    from .batch import Submission, Verdict
 
 
 T = TypeVar('T')
@@ -17,19 +22,6 @@ T1 = TypeVar('T1')
 T2 = TypeVar('T2')
 
 
-def checker_thread(q_in: Queue, q_out: Queue):
-    while True:
-        method, value = q_in.get()
-        if method is None:
-            break
-        try:
-            value = method(value)
-        except BaseException as e:
-            value = Raised(e)
-        q_in.task_done()
-        q_out.put(value)
-
-
 class Exercise:
     __slots__ = ('tasks', 'complexity')
 
@@ -46,38 +38,46 @@ class Exercise:
     def _validate_iteration(
             self,
             gen: Generator,
-            check_values: ValuesTuple
+            check_values: ValuesTuple,
+            worker: Optional[Worker] = None,
+            step_timeout: Optional[float] = None,
+            iteration_timeout: Optional[float] = None
     ) -> str:
         """
         Validates just started generator. Method calls "gen.send(None) on start
         :param gen: Collective generator of all tasks contained in `tasks` variable
+        :param worker: Worker, executing generator methods. If None,
+            worker is taken from default pool for this iteration only
+        :param step_timeout: Seconds to wait for each generator answer
+        :param iteration_timeout: Seconds to wait for all generator answers
         :return: String with error message. If len(str) == 0, no error occurred
         """
-        q_in = Queue()
-        q_out = Queue()
-        gen_thread = Thread(
-            target=checker_thread,
-            args=(q_in, q_out),
-            name='Generator checker'
-        )
-        gen_thread.start()
+        if worker is None:
+            worker = default_pool.acquire()
+            try:
+                return self._validate_iteration(
+                    gen, check_values, worker, step_timeout, iteration_timeout
+                )
+            finally:
+                default_pool.release(worker)
+        deadline = None
+        if iteration_timeout is not None:
+            deadline = perf_counter() + iteration_timeout
         iteration = 0
         output = StringIO()
         try:
-            q_in.put((gen.send, None))
-            q_out.get()
-            q_out.task_done()
+            worker.limit(self._step_limit(step_timeout, deadline))
+            worker.call(gen.send, None)
             for send, awaited in zip(check_values.send, check_values.awaited):
+                worker.limit(self._step_limit(step_timeout, deadline))
                 if isinstance(send, CheckHook):
-                    gen_out = send(q_in, q_out, gen)
+                    gen_out = worker.hook(send, gen)
                 else:
-                    q_in.put((gen.send, send))
-                    gen_out = q_out.get()
+                    gen_out = worker.call(gen.send, send)
                 if isinstance(awaited, Checker):
                     gen_out = awaited.output_value(gen_out)
                     if gen_out:
                         if gen_out == 'FINISH':
-                            q_in.put((None, None))
                             return ''
                         output.write(gen_out)
                         break
@@ -99,8 +99,9 @@ class Exercise:
                 iteration += 1
         except StopIteration:
             output.write('Генератор неожиданно завершился')
-        # except TimeoutError:
-        #     output.write(f'Генератор не дал ответ после {TIMEOUT} секунд')
+        except WorkerTimeout:
+            worker.interrupt()
+            output.write(self._timeout_message(step_timeout, iteration_timeout, deadline))
         except Exception as e:
             output.write(
                 f"Неожиданное исключение: "
@@ -121,17 +122,44 @@ class Exercise:
         elif output.tell() == 0:
             # Generator should be closed by now
             try:
-                gen.send(None)
-            except StopIteration:
-                pass
+                worker.limit(self._step_limit(step_timeout, deadline))
+                gen_out = worker.call(gen.send, None)
+            except WorkerTimeout:
+                worker.interrupt()
+                output.write(self._timeout_message(step_timeout, iteration_timeout, deadline))
             else:
-                output.write('Генератор не остановился после выполнения всех задач')
-
-        q_in.put((None, None))
-        gen_thread.join()
+                if not isinstance(gen_out, Raised):
+                    output.write('Генератор не остановился после выполнения всех задач')
+                elif not isinstance(gen_out.exception, StopIteration):
+                    e = gen_out.exception
+                    output.write(
+                        f"Неожиданное исключение: "
+                        f"{type(e).__qualname__}({e.args})"
+                    )
 
         return output.getvalue()
 
+    @staticmethod
+    def _step_limit(step_timeout: Optional[float], deadline: Optional[float]) -> Optional[float]:
+        if deadline is None:
+            return step_timeout
+        left = deadline - perf_counter()
+        if left <= 0:
+            raise WorkerTimeout(left)
+        if step_timeout is None:
+            return left
+        return min(step_timeout, left)
+
+    @staticmethod
+    def _timeout_message(
+            step_timeout: Optional[float],
+            iteration_timeout: Optional[float],
+            deadline: Optional[float]
+    ) -> str:
+        if deadline is not None and perf_counter() >= deadline:
+            return f'Генератор не выполнил итерацию проверки за {iteration_timeout} секунд'
+        return f'Генератор не дал ответ после {step_timeout} секунд'
+
     def save(self) -> tuple[tuple[str, ...], ...]:
         return tuple((task.save() for task in self.tasks))
 
@@ -162,14 +190,79 @@ class Exercise:
                 awaited.extend(value_tuple.awaited)
             yield ValuesTuple(send, awaited)
 
-    def validate(self, factory: Callable[[], Generator], max_iterations: int = 500) -> str:
+    def validate(
+            self,
+            factory: Callable[[], Generator],
+            max_iterations: int = 500,
+            pool: Optional[WorkerPool] = None,
+            direct: bool = False,
+            step_timeout: Optional[float] = None,
+            iteration_timeout: Optional[float] = None
+    ) -> str:
+        """
+        Validates generator factory against all check values
+        :param factory: Callable, returning new generator on each call
+        :param max_iterations: Maximum amount of ValuesTuple to check
+        :param pool: Pool to take checker worker from. Single worker is used
+            for all iterations and returned to pool afterwards. Default pool if None
+        :param direct: Run generator in calling thread without any queues.
+            Much faster, but provides no isolation: use for trusted generators only
+        :param step_timeout: Seconds to wait for each generator answer.
+            Generator, exceeded limit, is interrupted and worker is replaced
+        :param iteration_timeout: Seconds to wait for all answers in single iteration.
+            In direct mode checked only between answers
+        :return: String with error message. Empty string, if no error occurred
+        """
         assert isinstance(max_iterations, int)
         assert max_iterations > 1
-        output = StringIO()
+        assert step_timeout is None or step_timeout > 0
+        assert iteration_timeout is None or iteration_timeout > 0
+        if direct:
+            assert pool is None, 'Direct validation does not use worker pool'
+            assert step_timeout is None, 'Direct validation can\'t limit single step'
+            return self._validate_all(
+                factory, max_iterations, direct_worker, None, iteration_timeout
+            )
+        if pool is None:
+            pool = default_pool
+        worker = pool.acquire()
+        try:
+            return self._validate_all(
+                factory, max_iterations, worker, step_timeout, iteration_timeout
+            )
+        finally:
+            pool.release(worker)
 
+    def validate_many(
+            self,
+            submissions: Iterable['Submission'],
+            workers: Optional[int] = None,
+            **kwargs: Any
+    ) -> Generator['Verdict', None, None]:
+        """
+        Validates many submissions in pool of processes
+        :param submissions: Picklable generator factories or import paths 'module:qualname'
+        :param workers: Amount of processes. os.cpu_count() if None
+        :param kwargs: Arguments passed to validate() in each process
+        :return: Generator of kipygen.batch.Verdict in order of completion.
+            Verdict.index is index of submission
+        """
+        from .batch import validate_many
+        return validate_many(((self, s) for s in submissions), workers, **kwargs)
+
+    def _validate_all(
+            self,
+            factory: Callable[[], Generator],
+            max_iterations: int,
+            worker: Worker,
+            step_timeout: Optional[float],
+            iteration_timeout: Optional[float]
+    ) -> str:
         for check_values in iterations_limit(self.check_values(), max_iterations):
             gen = factory()
-            output = self._validate_iteration(gen, check_values)
+            output = self._validate_iteration(
+                gen, check_values, worker, step_timeout, iteration_timeout
+            )
             if output:
                 return output
         return ''
@@ -0,0 +1,268 @@
+import ctypes
+from threading import Lock, Thread
+from typing import Any, Callable, Generator, List, Optional, Tuple, Union
+
+from .checkers import Raised
+from .checkhooks import CheckHook
+
+__all__ = (
+    'WorkerTimeout',
+    'WorkerInterrupt',
+    'Channel',
+    'CheckerWorker',
+    'DirectWorker',
+    'Worker',
+    'WorkerPool',
+    'default_pool',
+    'direct_worker',
+)
+
+
+class WorkerTimeout(TimeoutError):
+    """ Raised in validating thread, when generator did not answer in time """
+
+
+class WorkerInterrupt(BaseException):
+    """ Raised asynchronously inside worker thread to stop generator, which exceeded time limit """
+
+
+def checker_thread(q_in, q_out):
+    try:
+        while True:
+            method, value = q_in.get()
+            if method is None:
+                break
+            try:
+                value = method(value)
+            except BaseException as e:
+                value = Raised(e)
+            q_in.task_done()
+            q_out.put(value)
+    except WorkerInterrupt:
+        pass
+
+
+def _async_raise(thread: Thread, exception: type) -> bool:
+    """ Raises exception in another thread as soon as it executes python code """
+    try:
+        set_async_exc = ctypes.pythonapi.PyThreadState_SetAsyncExc
+    except AttributeError:
+        return False
+    return set_async_exc(ctypes.c_ulong(thread.ident), ctypes.py_object(exception)) == 1
+
+
+class Channel:
+    """
+    Single slot handoff between two threads. Lighter replacement of Queue:
+    one put() is always followed by exactly one get(), so a single lock
+    used as binary semaphore is enough.
+    Implements put/get/task_done, so CheckHook.__call__ receives it as q_in/q_out
+    get() raises WorkerTimeout, if no value put during `timeout` seconds
+    """
+    __slots__ = ('_value', '_ready', 'timeout')
+
+    def __init__(self):
+        self._value = None
+        self._ready = Lock()
+        self._ready.acquire()
+        self.timeout: Optional[float] = None
+
+    def __repr__(self) -> str:
+        return f"<Channel {'empty' if self._ready.locked() else 'full'}>"
+
+    def put(self, value: Any) -> None:
+        self._value = value
+        self._ready.release()
+
+    def get(self) -> Any:
+        timeout = self.timeout
+        if timeout is None:
+            self._ready.acquire()
+        elif not self._ready.acquire(timeout=max(timeout, 0)):
+            raise WorkerTimeout(timeout)
+        value = self._value
+        self._value = None
+        return value
+
+    def task_done(self) -> None:
+        pass
+
+
+class CheckerWorker:
+    """
+    Long-living thread, which executes generator methods passed to it.
+    Can be reused between iterations and submissions
+    After timeout worker becomes broken and should not be reused
+    """
+    __slots__ = ('q_in', 'q_out', 'broken', '_thread')
+
+    def __init__(self, channel: Callable[[], Any] = Channel):
+        """
+        :param channel: Factory of handoff objects with put/get/task_done methods.
+            Channel by default, queue.Queue is accepted too
+        """
+        self.q_in = channel()
+        self.q_out = channel()
+        self.broken = False
+        self._thread = Thread(
+            target=checker_thread,
+            args=(self.q_in, self.q_out),
+            name='Generator checker',
+            daemon=True
+        )
+        self._thread.start()
+
+    def __repr__(self) -> str:
+        state = 'alive' if self.alive else 'stopped'
+        if self.broken:
+            state = f"broken {state}"
+        return f"<CheckerWorker {state}>"
+
+    @property
+    def alive(self) -> bool:
+        return self._thread.is_alive()
+
+    def call(self, method: Callable[[Any], Any], value: Any) -> Any:
+        """ Executes method(value) in worker thread
+        :return: Method result or Raised, if method raised an exception
+        """
+        self.q_in.put((method, value))
+        return self.q_out.get()
+
+    def hook(self, hook: CheckHook, gen: Generator) -> Any:
+        """ Passes worker channels to CheckHook """
+        return hook(self.q_in, self.q_out, gen)
+
+    def limit(self, timeout: Optional[float]) -> None:
+        """ Sets time to wait for each next answer. None disables limit
+        Works with Channel only, other channels wait forever
+        """
+        self.q_out.timeout = timeout
+
+    def interrupt(self, grace: float = 0.1) -> bool:
+        """ Stops worker, which may be stuck inside generator method
+        Generator is interrupted with WorkerInterrupt exception. Generator, which
+        catches BaseException or blocks in C code can't be interrupted: its
+        thread remains alive until generator returns
+        :param grace: Seconds to wait for thread to finish
+        :return: True, if thread finished
+        """
+        if self._thread.is_alive():
+            _async_raise(self._thread, WorkerInterrupt)
+            if not self.broken:
+                self.q_in.put((None, None))
+            self._thread.join(grace)
+        self.broken = True
+        return not self._thread.is_alive()
+
+    def stop(self) -> None:
+        self.q_in.put((None, None))
+        self._thread.join()
+
+
+class DirectWorker:
+    """
+    Executes generator methods right in calling thread, without any isolation.
+    Suitable for trusted generators only: infinite loop in generator hangs caller.
+    Time limits can't be applied to single step
+    """
+    __slots__ = ()
+    broken = False
+
+    def __repr__(self) -> str:
+        return "<DirectWorker>"
+
+    def call(self, method: Callable[[Any], Any], value: Any) -> Any:
+        """ Executes method(value)
+        :return: Method result or Raised, if method raised an exception
+        """
+        try:
+            return method(value)
+        except KeyboardInterrupt:
+            raise
+        except BaseException as e:
+            return Raised(e)
+
+    def hook(self, hook: CheckHook, gen: Generator) -> Any:
+        """ Calls CheckHook.direct() """
+        try:
+            return hook.direct(gen)
+        except KeyboardInterrupt:
+            raise
+        except BaseException as e:
+            return Raised(e)
+
+    def limit(self, timeout: Optional[float]) -> None:
+        pass
+
+    def interrupt(self, grace: float = 0.1) -> bool:
+        return True
+
+
+Worker = Union[CheckerWorker, DirectWorker]
+
+
+class WorkerPool:
+    """
+    Small pool of CheckerWorker. Workers are created on demand,
+    at most `size` idle workers are kept for reuse.
+    Broken workers are never reused. If their thread failed to stop,
+    it is kept in `abandoned` until finished
+    """
+    __slots__ = ('size', '_idle', '_abandoned', '_lock')
+
+    def __init__(self, size: int = 4):
+        assert isinstance(size, int)
+        assert size >= 0
+        self.size = size
+        self._idle: List[CheckerWorker] = []
+        self._abandoned: List[CheckerWorker] = []
+        self._lock = Lock()
+
+    def __repr__(self) -> str:
+        return (
+            f"<WorkerPool size={self.size} idle={len(self._idle)} "
+            f"abandoned={len(self.abandoned)}>"
+        )
+
+    @property
+    def abandoned(self) -> List[CheckerWorker]:
+        """ Broken workers, which threads are still running """
+        with self._lock:
+            self._abandoned = [w for w in self._abandoned if w.alive]
+            return self._abandoned.copy()
+
+    def __enter__(self) -> 'WorkerPool':
+        return self
+
+    def __exit__(self, *args: Tuple[Any, ...]) -> None:
+        self.close()
+
+    def acquire(self) -> CheckerWorker:
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+        return CheckerWorker()
+
+    def release(self, worker: CheckerWorker) -> None:
+        assert isinstance(worker, CheckerWorker)
+        if worker.broken:
+            if not worker.interrupt():
+                with self._lock:
+                    self._abandoned.append(worker)
+            return
+        with self._lock:
+            if len(self._idle) < self.size:
+                self._idle.append(worker)
+                return
+        worker.stop()
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for worker in idle:
+            worker.stop()
+
+
+default_pool = WorkerPool()
+direct_worker = DirectWorker()
@@ -0,0 +1,45 @@
+from unittest import TestCase
+
+from kipygen import TaskMeta, Exercise
+from kipygen.batch import resolve_factory, validate_many
+
+
+class TestBatch(TestCase):
+    __slots__ = ()
+
+    def setUp(self):
+        for name in ('TaskRange', 'TaskPassword'):
+            if TaskMeta.find_task(name) is None:
+                self.skipTest(f"Can't find task {name}")
+
+    def test_resolve_factory(self):
+        cl = TaskMeta.find_task('TaskRange')
+        self.assertIs(resolve_factory('kipygen.tasks:TaskRange.generator'), cl.generator)
+        self.assertIs(resolve_factory(cl.generator), cl.generator)
+        with self.assertRaises(ValueError):
+            resolve_factory('kipygen.tasks')
+
+    def test_validate_many(self):
+        e = Exercise.load((('TaskRange', ), ))
+        submissions = [
+            'kipygen.tasks:TaskRange.generator',
+            'kipygen.tasks:TaskPassword.generator',
+            TaskMeta.find_task('TaskRange').generator,
+            'kipygen.tasks:TaskMissing.generator',
+        ]
+        verdicts = sorted(e.validate_many(submissions, workers=2))
+        self.assertEqual([v.index for v in verdicts], [0, 1, 2, 3])
+        self.assertEqual([v.passed for v in verdicts], [True, False, True, False])
+        self.assertIn('Не удалось загрузить решение', verdicts[3].output)
+
+    def test_many_exercises(self):
+        jobs = [
+            (Exercise.load((('TaskRange', ), )), 'kipygen.tasks:TaskRange.generator'),
+            (Exercise.load((('TaskPassword', ), )), 'kipygen.tasks:TaskPassword.generator'),
+        ]
+        verdicts = sorted(validate_many(jobs, workers=2))
+        self.assertEqual(
+            [v.exercise for v in verdicts],
+            [(('TaskRange', ), ), (('TaskPassword', ), )]
+        )
+        self.assertTrue(all(v.passed for v in verdicts))
@@ -0,0 +1,55 @@
+from unittest import TestCase
+from threading import active_count
+from time import perf_counter
+
+from kipygen import TaskMeta, Exercise
+from kipygen.workers import WorkerPool
+
+
+class TestTimeouts(TestCase):
+    __slots__ = ('e', )
+
+    def setUp(self):
+        cl = TaskMeta.find_task('TaskRange')
+        if cl is None:
+            self.skipTest("Can't find task TaskRange")
+        self.e = Exercise([cl(next(cl.init_values()))])
+
+    @staticmethod
+    def endless():
+        yield
+        yield
+        while True:
+            pass
+
+    @staticmethod
+    def slow():
+        yield
+        while True:
+            start = perf_counter()
+            while perf_counter() - start < 0.02:
+                pass
+            yield
+
+    def test_step_timeout(self):
+        with WorkerPool(1) as pool:
+            threads = active_count()
+            for _ in range(3):
+                output = self.e.validate(self.endless, pool=pool, step_timeout=0.05)
+                self.assertIn('не дал ответ после 0.05 секунд', output)
+            self.assertLessEqual(active_count(), threads + 1)
+            self.assertFalse(pool.abandoned)
+            self.assertEqual('', self.e.validate(self.e.tasks[0].generator, pool=pool))
+
+    def test_iteration_timeout(self):
+        output = self.e.validate(self.slow, iteration_timeout=0.03)
+        self.assertIn('не выполнил итерацию проверки за 0.03 секунд', output)
+
+    def test_iteration_timeout_direct(self):
+        output = self.e.validate(self.slow, direct=True, iteration_timeout=0.03)
+        self.assertIn('не выполнил итерацию проверки за 0.03 секунд', output)
+
+    def test_no_timeout(self):
+        self.assertEqual('', self.e.validate(
+            self.e.tasks[0].generator, step_timeout=1, iteration_timeout=5
+        ))
@@ -0,0 +1,144 @@
+from unittest import TestCase
+from queue import Queue
+
+from kipygen import TaskMeta, Exercise
+from kipygen.checkers import Raised
+from kipygen.checkhooks import CheckHook, GenThrow
+from kipygen.workers import Channel, CheckerWorker, WorkerPool, direct_worker
+
+
+class TestChannel(TestCase):
+    __slots__ = ()
+
+    def test_put_get(self):
+        channel = Channel()
+        for value in (1, None, 'value'):
+            channel.put(value)
+            self.assertEqual(channel.get(), value)
+
+
+class TestCheckerWorker(TestCase):
+    __slots__ = ()
+
+    def test_call(self):
+        worker = CheckerWorker()
+        try:
+            self.assertEqual(worker.call(abs, -5), 5)
+            raised = worker.call(int, 'not a number')
+            self.assertIsInstance(raised, Raised)
+            self.assertIsInstance(raised.exception, ValueError)
+        finally:
+            worker.stop()
+        self.assertFalse(worker.alive)
+
+    def test_queue_channel(self):
+        worker = CheckerWorker(Queue)
+        try:
+            self.assertEqual(worker.call(abs, -5), 5)
+        finally:
+            worker.stop()
+
+    def test_hook(self):
+        def gen():
+            try:
+                yield 1
+            except StopIteration:
+                yield 2
+
+        worker = CheckerWorker()
+        try:
+            g = gen()
+            self.assertEqual(worker.call(g.send, None), 1)
+            self.assertEqual(worker.hook(GenThrow(StopIteration), g), 2)
+        finally:
+            worker.stop()
+
+
+class TestWorkerPool(TestCase):
+    __slots__ = ()
+
+    def test_reuse(self):
+        with WorkerPool(1) as pool:
+            worker = pool.acquire()
+            pool.release(worker)
+            self.assertIs(pool.acquire(), worker)
+            other = pool.acquire()
+            self.assertIsNot(other, worker)
+            pool.release(worker)
+            pool.release(other)
+            self.assertFalse(other.alive)
+        self.assertFalse(worker.alive)
+
+    def test_validate(self):
+        cl = TaskMeta.find_task('TaskRange')
+        if cl is None:
+            self.skipTest("Can't find task TaskRange")
+        e = Exercise([cl(next(cl.init_values()))])
+        with WorkerPool(1) as pool:
+            self.assertEqual('', e.validate(cl.generator, pool=pool))
+            self.assertEqual('', e.validate(cl.generator, pool=pool))
+            self.assertEqual(len(pool._idle), 1)
+
+
+class TestDirectWorker(TestCase):
+    __slots__ = ()
+
+    def test_call(self):
+        self.assertEqual(direct_worker.call(abs, -5), 5)
+        raised = direct_worker.call(int, 'not a number')
+        self.assertIsInstance(raised, Raised)
+        self.assertIsInstance(raised.exception, ValueError)
+
+    def test_hook(self):
+        def gen():
+            yield 1
+
+        g = gen()
+        next(g)
+        raised = direct_worker.hook(GenThrow(ValueError), g)
+        self.assertIsInstance(raised, Raised)
+        self.assertIsInstance(raised.exception, ValueError)
+
+    def test_default_direct(self):
+        class Forward(CheckHook):
+            __slots__ = ('value', )
+
+            def __init__(self, value):
+                self.value = value
+
+            def __call__(self, q_in, q_out, gen):
+                q_in.put((gen.send, self.value))
+                return q_out.get()
+
+        def gen():
+            value = yield
+            while True:
+                value = yield value * 2
+
+        g = gen()
+        next(g)
+        self.assertEqual(direct_worker.hook(Forward(2), g), 4)
+        g.close()
+        raised = direct_worker.hook(Forward(2), g)
+        self.assertIsInstance(raised, Raised)
+        self.assertIsInstance(raised.exception, StopIteration)
+
+    def test_validate(self):
+        for task in TaskMeta.all_tasks:
+            task = task(next(task.init_values()))
+            e = Exercise([task])
+            self.assertEqual('', e.validate(task.generator, direct=True))
+
+    def test_validate_error(self):
+        cl = TaskMeta.find_task('TaskRange')
+        if cl is None:
+            self.skipTest("Can't find task TaskRange")
+        e = Exercise([cl(next(cl.init_values()))])
+
+        def gen():
+            yield
+            yield
+            yield
+            raise ValueError()
+
+        self.assertIn('ValueError', e.validate(gen, direct=True))